@@ -1,6 +1,67 @@
 from django.contrib import admin
 from taskassignment.models import *
+from taskassignment.events import publish_task_event
+from taskassignment.paginators import EstimatedCountPaginator
 
 # Register your models here.
-admin.site.register(Contributor)
-admin.site.register(Task)
\ No newline at end of file
+
+@admin.register(Contributor)
+class ContributorAdmin(admin.ModelAdmin):
+    list_display = ('name', 'email')
+    # Prefix/exact lookups so the UPPER(...) indexes on contributor can be used
+    search_fields = ('^name', '=email')
+    ordering = ('name',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    list_display = ('title', 'contributor', 'start', 'end_date', 'is_completed')
+    list_select_related = ('contributor',)
+    list_filter = ('is_completed', 'end_date')
+    search_fields = ('^title',)
+    autocomplete_fields = ('contributor',)
+    ordering = ('-id',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    actions = ('mark_completed', 'mark_pending')
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        publish_task_event('task_updated' if change else 'task_created', obj)
+
+    @admin.action(description='Mark selected tasks as completed')
+    def mark_completed(self, request, queryset):
+        updated = queryset.update(is_completed=True)
+        publish_task_event('tasks_bulk_updated')
+        self.message_user(request, f'{updated} task(s) marked as completed.')
+
+    @admin.action(description='Mark selected tasks as pending')
+    def mark_pending(self, request, queryset):
+        updated = queryset.update(is_completed=False)
+        publish_task_event('tasks_bulk_updated')
+        self.message_user(request, f'{updated} task(s) marked as pending.')
+
+
+@admin.register(Attendance)
+class AttendanceAdmin(admin.ModelAdmin):
+    list_display = ('contributor', 'date', 'is_available')
+    list_select_related = ('contributor',)
+    list_filter = ('is_available', 'date')
+    search_fields = ('^contributor__name',)
+    raw_id_fields = ('contributor',)
+    ordering = ('-date',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    actions = ('mark_available', 'mark_unavailable')
+
+    @admin.action(description='Mark selected records as available')
+    def mark_available(self, request, queryset):
+        updated = queryset.update(is_available=True)
+        self.message_user(request, f'{updated} attendance record(s) marked as available.')
+
+    @admin.action(description='Mark selected records as unavailable')
+    def mark_unavailable(self, request, queryset):
+        updated = queryset.update(is_available=False)
+        self.message_user(request, f'{updated} attendance record(s) marked as unavailable.')
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class TaskassignmentConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'taskassignment'
+
+    def ready(self):
+        from taskassignment.events import check_backend
+        check_backend()
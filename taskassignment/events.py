@@ -0,0 +1,153 @@
+"""Fan-out of task change events to server-sent event streams.
+
+By default events are delivered to streams in the same process. Set
+``TASK_EVENTS_BACKEND = 'postgres'`` when running several ASGI workers: events
+are then sent with ``pg_notify`` and each worker relays them from a single
+``LISTEN`` connection (requires psycopg 3).
+"""
+import asyncio
+import json
+import threading
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.handlers.asgi import ASGIRequest
+from django.db import connection, transaction
+from django.db.models import Count, Q
+
+from taskassignment.models import Contributor, Task
+
+CHANNEL = 'task_events'
+# Seconds between keep-alive comments on an idle stream
+HEARTBEAT_SECONDS = 15
+# Streams are closed after this long; EventSource reconnects on its own
+MAX_STREAM_SECONDS = 300
+# Events buffered per client before further events are dropped
+QUEUE_SIZE = 100
+
+_subscribers = set()
+_lock = threading.Lock()
+_listener = None
+
+
+def _backend():
+    return getattr(settings, 'TASK_EVENTS_BACKEND', 'local')
+
+
+def check_backend():
+    """Fail at startup, not on the first stream, when the postgres backend cannot be used"""
+    if _backend() != 'postgres':
+        return
+    try:
+        import psycopg  # noqa: F401
+    except ImportError:
+        raise ImproperlyConfigured("TASK_EVENTS_BACKEND = 'postgres' requires psycopg 3.")
+
+
+def live_updates_enabled(request):
+    # Under WSGI a streaming response is read to the end before anything is sent, so only stream over ASGI
+    return getattr(settings, 'TASK_EVENTS_ENABLED', True) and isinstance(request, ASGIRequest)
+
+
+def dashboard_counters():
+    """Dashboard stat card values, computed once per event instead of once per page reload"""
+    totals = Task.objects.aggregate(
+        total=Count('id'),
+        completed=Count('id', filter=Q(is_completed=True)),
+    )
+    return {
+        'total_tasks': totals['total'],
+        'completed_tasks': totals['completed'],
+        'pending_tasks': totals['total'] - totals['completed'],
+        'total_contributors': Contributor.objects.count(),
+    }
+
+
+def publish_task_event(event_type, task=None):
+    """Broadcast a task change once the surrounding transaction commits; bulk changes pass no task"""
+    def send():
+        # Nobody in this process is listening, so skip the counter queries
+        if _backend() != 'postgres' and not _subscribers:
+            return
+        event = {'type': event_type, 'counters': dashboard_counters()}
+        if task is not None:
+            event['task'] = {
+                'id': task.id,
+                'title': task.title,
+                'is_completed': task.is_completed,
+                'contributor_id': task.contributor_id,
+            }
+        payload = json.dumps(event)
+        if _backend() == 'postgres':
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_notify(%s, %s)", [CHANNEL, payload])
+        else:
+            _fan_out(payload)
+
+    transaction.on_commit(send)
+
+
+def _fan_out(payload):
+    # Publishers run in sync view threads; hand the payload to each stream's event loop
+    with _lock:
+        subscribers = list(_subscribers)
+    for loop, queue in subscribers:
+        loop.call_soon_threadsafe(_offer, queue, payload)
+
+
+def _offer(queue, payload):
+    try:
+        queue.put_nowait(payload)
+    except asyncio.QueueFull:
+        # Slow client; it resyncs on its next page load
+        pass
+
+
+def _ensure_listener(loop):
+    global _listener
+    if _listener is None or _listener.done():
+        _listener = loop.create_task(_listen())
+
+
+async def _listen():
+    import psycopg
+
+    db = settings.DATABASES['default']
+    params = {
+        'dbname': db.get('NAME'),
+        'user': db.get('USER'),
+        'password': db.get('PASSWORD'),
+        'host': db.get('HOST'),
+        'port': db.get('PORT'),
+    }
+    conninfo = psycopg.conninfo.make_conninfo(**{k: v for k, v in params.items() if v})
+    while True:
+        try:
+            async with await psycopg.AsyncConnection.connect(conninfo, autocommit=True) as conn:
+                await conn.execute(f'LISTEN {CHANNEL}')
+                async for notify in conn.notifies():
+                    _fan_out(notify.payload)
+        except psycopg.OperationalError:
+            await asyncio.sleep(5)
+
+
+async def subscribe():
+    """Yield event payloads for one client, or None when a keep-alive is due"""
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+    entry = (loop, queue)
+    if _backend() == 'postgres':
+        _ensure_listener(loop)
+
+    try:
+        with _lock:
+            _subscribers.add(entry)
+        deadline = loop.time() + MAX_STREAM_SECONDS
+        while loop.time() < deadline:
+            try:
+                yield await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield None
+    finally:
+        with _lock:
+            _subscribers.discard(entry)
@@ -0,0 +1,53 @@
+from collections import defaultdict
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from taskassignment.models import DUE_SOON_DAYS, Task, TaskDigest, TaskDigestBuild
+
+
+class Command(BaseCommand):
+    help = "Precompute per-contributor overdue and due-soon task counts for the dashboard"
+
+    def handle(self, *args, **options):
+        today = date.today()
+        # Same window as Task.objects.due_soon(), which the dashboard links to
+        horizon = today + timedelta(days=DUE_SOON_DAYS)
+
+        # One range scan over the pending end_date partial index covers both buckets
+        rows = (Task.objects.pending()
+                .filter(end_date__lte=horizon)
+                .order_by('contributor_id', 'end_date')
+                .values_list('contributor_id', 'id', 'end_date'))
+
+        overdue = defaultdict(list)
+        due_soon = defaultdict(list)
+        for contributor_id, task_id, end_date in rows.iterator():
+            if end_date < today:
+                overdue[contributor_id].append(task_id)
+            else:
+                due_soon[contributor_id].append(task_id)
+
+        digests = [
+            TaskDigest(
+                digest_date=today,
+                contributor_id=contributor_id,
+                overdue_count=len(overdue[contributor_id]),
+                overdue_task_ids=overdue[contributor_id],
+                due_soon_count=len(due_soon[contributor_id]),
+                due_soon_task_ids=due_soon[contributor_id],
+            )
+            for contributor_id in set(overdue) | set(due_soon)
+        ]
+
+        # Swap the whole digest at once so the dashboard never sees a partial build
+        with transaction.atomic():
+            TaskDigest.objects.all().delete()
+            TaskDigest.objects.bulk_create(digests)
+            TaskDigestBuild.objects.create(digest_date=today)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Task digest built for {today}: {len(digests)} contributors, '
+            f'{sum(map(len, overdue.values()))} overdue, {sum(map(len, due_soon.values()))} due soon.'
+        ))
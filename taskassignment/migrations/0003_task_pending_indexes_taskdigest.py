@@ -0,0 +1,39 @@
+# Generated by Django 4.2.24 on 2026-10-19 09:00
+
+import datetime
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taskassignment', '0002_attendance'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('is_completed', False)), fields=['end_date'], name='task_pending_end_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('is_completed', False)), fields=['contributor', 'end_date'], name='task_pending_contrib_end_idx'),
+        ),
+        migrations.CreateModel(
+            name='TaskDigest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('digest_date', models.DateField(default=datetime.date.today)),
+                ('overdue_count', models.PositiveIntegerField(default=0)),
+                ('overdue_task_ids', models.JSONField(default=list)),
+                ('due_soon_count', models.PositiveIntegerField(default=0)),
+                ('due_soon_task_ids', models.JSONField(default=list)),
+                ('contributor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='taskassignment.contributor')),
+            ],
+            options={
+                'db_table': 'task_digest',
+                'unique_together': {('contributor', 'digest_date')},
+            },
+        ),
+    ]
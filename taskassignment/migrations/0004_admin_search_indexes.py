@@ -0,0 +1,31 @@
+# Generated by Django 4.2.24 on 2026-10-19 10:00
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taskassignment', '0003_task_pending_indexes_taskdigest'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contributor',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='text_pattern_ops'), name='contributor_name_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contributor',
+            index=models.Index(django.db.models.functions.text.Upper('email'), name='contributor_email_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('title'), name='text_pattern_ops'), name='task_title_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['date'], name='attendance_date_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.24 on 2026-10-19 11:00
+
+import datetime
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.functions.datetime
+import taskassignment.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taskassignment', '0004_admin_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=django.contrib.postgres.indexes.GistIndex(taskassignment.models.DateRange(django.db.models.functions.datetime.TruncDate('start', tzinfo=datetime.timezone.utc), 'end_date', models.Value('[]')), name='task_span_gist_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.24 on 2026-10-19 12:00
+
+import datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taskassignment', '0005_task_span_gist_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskDigestBuild',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('digest_date', models.DateField(default=datetime.date.today)),
+                ('built_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'task_digest_build',
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.24 on 2026-10-19 12:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('taskassignment', '0006_taskdigestbuild'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['end_date'], name='task_end_date_idx'),
+        ),
+    ]
@@ -1,6 +1,12 @@
 from django.db import models
+from django.contrib.postgres.fields import DateRangeField
+from django.contrib.postgres.indexes import GistIndex, OpClass
 from django.core.exceptions import ValidationError
-from datetime import datetime, date
+from django.db.models.functions import TruncDate, Upper
+from datetime import datetime, date, timedelta, timezone as dt_timezone
+
+# Number of days ahead of today that a pending task counts as "due soon"
+DUE_SOON_DAYS = 7
 
 
 class Contributor(models.Model):
@@ -12,11 +18,46 @@ class Contributor(models.Model):
   
     class Meta:
         db_table = "contributor"
+        indexes = [
+            # Serve the admin's case-insensitive prefix/exact searches
+            models.Index(OpClass(Upper('name'), name='text_pattern_ops'), name='contributor_name_upper_idx'),
+            models.Index(Upper('email'), name='contributor_email_upper_idx'),
+        ]
 
 
 
 # Create your models here.
 
+class DateRange(models.Func):
+    """PostgreSQL daterange(lower, upper, bounds) constructor"""
+    function = 'daterange'
+    output_field = DateRangeField()
+
+
+def task_span():
+    # Inclusive [start day, end_date] range; the UTC cast keeps the expression immutable so it can be indexed
+    return DateRange(TruncDate('start', tzinfo=dt_timezone.utc), 'end_date', models.Value('[]'))
+
+
+class TaskQuerySet(models.QuerySet):
+    def pending(self):
+        return self.filter(is_completed=False)
+
+    def overdue(self, today=None):
+        """Pending tasks whose end date has already passed"""
+        today = today or date.today()
+        return self.pending().filter(end_date__lt=today)
+
+    def due_soon(self, today=None, days=DUE_SOON_DAYS):
+        """Pending tasks ending between today and `days` days from now"""
+        today = today or date.today()
+        return self.pending().filter(end_date__gte=today, end_date__lte=today + timedelta(days=days))
+
+    def active_between(self, first_day, last_day):
+        """Tasks whose [start, end_date] span overlaps the inclusive window, served by the span GiST index"""
+        return self.annotate(span=task_span()).filter(span__overlap=(first_day, last_day + timedelta(days=1)))
+
+
 class Task(models.Model):
     title = models.CharField(max_length=200,null=False)
     description = models.TextField(max_length=500)
@@ -25,6 +66,7 @@ class Task(models.Model):
     is_completed = models.BooleanField(default=False)
     contributor = models.ForeignKey(Contributor, on_delete=models.CASCADE)
 
+    objects = TaskQuerySet.as_manager()
 
     def clean(self):
         super().clean()
@@ -42,6 +84,17 @@ class Task(models.Model):
 
     class Meta:
         db_table = "task"
+        indexes = [
+            # Partial indexes: only pending tasks can be overdue or due soon
+            models.Index(fields=['end_date'], name='task_pending_end_date_idx',
+                         condition=models.Q(is_completed=False)),
+            models.Index(fields=['contributor', 'end_date'], name='task_pending_contrib_end_idx',
+                         condition=models.Q(is_completed=False)),
+            # Unconditional index for the admin end_date filter, which also covers completed tasks
+            models.Index(fields=['end_date'], name='task_end_date_idx'),
+            models.Index(OpClass(Upper('title'), name='text_pattern_ops'), name='task_title_upper_idx'),
+            GistIndex(task_span(), name='task_span_gist_idx'),
+        ]
 
 
 class Attendance(models.Model):
@@ -54,4 +107,36 @@ class Attendance(models.Model):
 
     class Meta:
         db_table = "attendance"
-        unique_together = ("contributor", "date")
\ No newline at end of file
+        unique_together = ("contributor", "date")
+        indexes = [
+            models.Index(fields=['date'], name='attendance_date_idx'),
+        ]
+
+
+class TaskDigest(models.Model):
+    """Per-contributor overdue/due-soon summary, rebuilt daily by `build_task_digest`"""
+    digest_date = models.DateField(default=date.today)
+    contributor = models.ForeignKey(Contributor, on_delete=models.CASCADE)
+    overdue_count = models.PositiveIntegerField(default=0)
+    overdue_task_ids = models.JSONField(default=list)
+    due_soon_count = models.PositiveIntegerField(default=0)
+    due_soon_task_ids = models.JSONField(default=list)
+
+    def __str__(self):
+        return f"{self.contributor.name} - {self.digest_date} - {self.overdue_count} overdue"
+
+    class Meta:
+        db_table = "task_digest"
+        unique_together = ("contributor", "digest_date")
+
+
+class TaskDigestBuild(models.Model):
+    """One row per successful `build_task_digest` run, kept even when no contributor has overdue work"""
+    digest_date = models.DateField(default=date.today)
+    built_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Task digest {self.digest_date}"
+
+    class Meta:
+        db_table = "task_digest_build"
@@ -1,3 +1,355 @@
-from django.test import TestCase
+import asyncio
+import json
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from io import StringIO
+from unittest import mock
+
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from taskassignment.admin import AttendanceAdmin, TaskAdmin
+from taskassignment.models import DUE_SOON_DAYS, Attendance, Contributor, Task, TaskDigest, TaskDigestBuild
+from taskassignment.paginators import EstimatedCountPaginator
+from taskassignment import events, views
 
 # Create your tests here.
+
+def make_task(contributor, start_day, end_date, is_completed=False, title='Task'):
+    return Task.objects.create(
+        title=title,
+        description='',
+        start=datetime.combine(start_day, time(9), tzinfo=dt_timezone.utc),
+        end_date=end_date,
+        is_completed=is_completed,
+        contributor=contributor,
+    )
+
+
+class AttendanceSaveTests(TestCase):
+    def setUp(self):
+        self.url = reverse('taskassignment:attendance_save')
+        self.day = date(2026, 1, 5)
+        self.alice = Contributor.objects.create(name='Alice', email='alice@example.com')
+        self.bob = Contributor.objects.create(name='Bob', email='bob@example.com')
+        self.carol = Contributor.objects.create(name='Carol', email='carol@example.com')
+        Attendance.objects.create(contributor=self.bob, date=self.day, is_available=True)
+
+    def post(self, payload):
+        body = payload if isinstance(payload, str) else json.dumps(payload)
+        return self.client.post(self.url, data=body, content_type='application/json')
+
+    def test_only_changed_rows_are_written(self):
+        response = self.post({
+            'date': self.day.isoformat(),
+            'changes': {str(self.alice.id): True, str(self.bob.id): False},
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'success': True, 'saved': 2})
+        records = dict(Attendance.objects.filter(date=self.day).values_list('contributor_id', 'is_available'))
+        self.assertEqual(records, {self.alice.id: True, self.bob.id: False})
+
+    def test_unknown_contributor_ids_are_dropped(self):
+        response = self.post({
+            'date': self.day.isoformat(),
+            'changes': {str(self.alice.id): True, '999999': True},
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['saved'], 1)
+        self.assertFalse(Attendance.objects.filter(contributor_id=999999).exists())
+
+    def test_malformed_body_is_rejected(self):
+        for body in ['not json', '[]', json.dumps({'date': self.day.isoformat(), 'changes': {'abc': True}})]:
+            response = self.post(body)
+            self.assertEqual(response.status_code, 400, body)
+
+    def test_non_boolean_values_are_rejected(self):
+        response = self.post({'date': self.day.isoformat(), 'changes': {str(self.alice.id): 'false'}})
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Attendance.objects.filter(contributor=self.alice).exists())
+
+    def test_invalid_date_is_rejected(self):
+        response = self.post({'date': '2024-02-30', 'changes': {str(self.alice.id): True}})
+        self.assertEqual(response.status_code, 400)
+
+    def test_change_cap(self):
+        changes = {str(i): True for i in range(views.ATTENDANCE_MAX_CHANGES + 1)}
+        response = self.post({'date': self.day.isoformat(), 'changes': changes})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Attendance.objects.count(), 1)
+
+
+class AttendanceTakeTests(TestCase):
+    def test_impossible_date_falls_back_to_today(self):
+        response = self.client.get(reverse('taskassignment:attendance_take'), {'date': '2024-02-30'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['day'], date.today())
+
+    def test_impossible_posted_date_is_rejected(self):
+        contributor = Contributor.objects.create(name='Alice', email='alice@example.com')
+        url = reverse('taskassignment:attendance_take')
+        response = self.client.post(url, {
+            'date': '2024-02-30',
+            'contributor_ids': [contributor.id],
+            f'present_{contributor.id}': 'on',
+        })
+        self.assertRedirects(response, url)
+        self.assertFalse(Attendance.objects.exists())
+
+
+class WorkloadCalendarTests(TestCase):
+    def test_impossible_start_falls_back_to_current_week(self):
+        today = date.today()
+        monday = today - timedelta(days=today.weekday())
+        response = self.client.get(reverse('taskassignment:workload_calendar'), {'start': '2024-02-30', 'format': 'json'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['start'], monday.isoformat())
+
+
+class ActiveBetweenTests(TestCase):
+    def setUp(self):
+        self.first_day = date(2026, 3, 2)
+        self.last_day = date(2026, 3, 8)
+        self.alice = Contributor.objects.create(name='Alice', email='alice@example.com')
+        self.ends_on_first_day = make_task(self.alice, date(2026, 2, 20), self.first_day, title='Ends first day')
+        self.starts_on_last_day = make_task(self.alice, self.last_day, date(2026, 3, 10), title='Starts last day')
+        self.spans_window = make_task(self.alice, date(2026, 2, 1), date(2026, 3, 31), title='Spans window')
+        # Entirely before and entirely after the window
+        make_task(self.alice, date(2026, 2, 1), date(2026, 3, 1))
+        make_task(self.alice, date(2026, 3, 9), date(2026, 3, 12))
+
+    def test_window_edges_are_inclusive(self):
+        tasks = set(Task.objects.active_between(self.first_day, self.last_day))
+        self.assertEqual(tasks, {self.ends_on_first_day, self.starts_on_last_day, self.spans_window})
+
+    def test_single_day_window(self):
+        self.assertEqual(set(Task.objects.active_between(self.last_day, self.last_day)),
+                         {self.starts_on_last_day, self.spans_window})
+
+    def test_json_assigns_tasks_and_attendance_to_days(self):
+        Attendance.objects.create(contributor=self.alice, date=self.first_day, is_available=True)
+        Attendance.objects.create(contributor=self.alice, date=date(2026, 3, 3), is_available=False)
+
+        response = self.client.get(reverse('taskassignment:workload_calendar'),
+                                   {'start': self.first_day.isoformat(), 'days': 7, 'format': 'json'})
+        data = response.json()
+        self.assertEqual((data['start'], data['end']), ('2026-03-02', '2026-03-08'))
+        days = data['contributors'][0]['days']
+        self.assertEqual([d['date'] for d in days], [(self.first_day + timedelta(days=i)).isoformat() for i in range(7)])
+        self.assertEqual(days[0]['tasks'], [self.spans_window.id, self.ends_on_first_day.id])
+        for cell in days[1:6]:
+            self.assertEqual(cell['tasks'], [self.spans_window.id])
+        self.assertEqual(days[6]['tasks'], [self.spans_window.id, self.starts_on_last_day.id])
+        self.assertEqual([d['available'] for d in days[:3]], [True, False, None])
+        self.assertEqual(set(data['tasks']), {str(t.id) for t in (self.ends_on_first_day, self.starts_on_last_day, self.spans_window)})
+
+
+class TaskEventsTests(TestCase):
+    def test_stream_is_refused_outside_asgi(self):
+        response = self.client.get(reverse('taskassignment:task_events'))
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(self.client.get(reverse('taskassignment:dashboard')).context['live_updates'])
+
+
+@override_settings(TASK_EVENTS_BACKEND='local')
+class TaskEventPublishTests(TestCase):
+    def setUp(self):
+        self.alice = Contributor.objects.create(name='Alice', email='alice@example.com')
+        self.task = make_task(self.alice, date(2026, 1, 5), date(2026, 1, 9), title='Write report')
+        make_task(self.alice, date(2026, 1, 5), date(2026, 1, 9), is_completed=True)
+
+    def subscribe_queue(self):
+        # Stand in for an open stream: a queue served by its own event loop
+        loop = asyncio.new_event_loop()
+        queue = asyncio.Queue()
+        entry = (loop, queue)
+        events._subscribers.add(entry)
+        self.addCleanup(loop.close)
+        self.addCleanup(events._subscribers.discard, entry)
+        return loop, queue
+
+    def test_toggle_publishes_to_subscribers(self):
+        loop, queue = self.subscribe_queue()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.get(reverse('taskassignment:task_toggle_complete', args=[self.task.id]))
+        loop.run_until_complete(asyncio.sleep(0))
+
+        event = json.loads(queue.get_nowait())
+        self.assertEqual(event['type'], 'task_toggled')
+        self.assertEqual(event['task'], {
+            'id': self.task.id,
+            'title': 'Write report',
+            'is_completed': True,
+            'contributor_id': self.alice.id,
+        })
+        self.assertEqual(event['counters'], {
+            'total_tasks': 2,
+            'completed_tasks': 2,
+            'pending_tasks': 0,
+            'total_contributors': 1,
+        })
+        self.assertTrue(queue.empty())
+
+    def test_no_subscribers_skips_counter_queries(self):
+        self.assertFalse(events._subscribers)
+        with self.assertNumQueries(0):
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                events.publish_task_event('task_updated', self.task)
+        self.assertEqual(len(callbacks), 1)
+
+
+class EstimatedCountPaginatorTests(TestCase):
+    def setUp(self):
+        for i in range(3):
+            Contributor.objects.create(name=f'Person {i}', email=f'person{i}@example.com')
+
+    def test_small_table_uses_exact_count(self):
+        self.assertEqual(EstimatedCountPaginator(Contributor.objects.all(), 10).count, 3)
+
+    def test_filtered_queryset_uses_exact_count_without_estimate(self):
+        queryset = Contributor.objects.filter(name__startswith='Person 1')
+        with self.assertNumQueries(1):
+            self.assertEqual(EstimatedCountPaginator(queryset, 10).count, 1)
+
+
+class AdminActionTests(TestCase):
+    def setUp(self):
+        self.contributor = Contributor.objects.create(name='Alice', email='alice@example.com')
+        start = date(2026, 1, 5)
+        self.tasks = [make_task(self.contributor, start, start + timedelta(days=3)) for _ in range(3)]
+        self.attendance = [
+            Attendance.objects.create(contributor=self.contributor, date=start + timedelta(days=i))
+            for i in range(3)
+        ]
+
+    def run_action(self, model_admin, action, queryset):
+        with mock.patch.object(type(model_admin), 'message_user'):
+            with self.assertNumQueries(1):
+                getattr(model_admin, action)(None, queryset)
+
+    def test_task_actions_issue_single_update(self):
+        task_admin = TaskAdmin(Task, admin.site)
+        self.run_action(task_admin, 'mark_completed', Task.objects.all())
+        self.assertFalse(Task.objects.filter(is_completed=False).exists())
+        self.run_action(task_admin, 'mark_pending', Task.objects.all())
+        self.assertFalse(Task.objects.filter(is_completed=True).exists())
+
+    def test_attendance_actions_issue_single_update(self):
+        attendance_admin = AttendanceAdmin(Attendance, admin.site)
+        self.run_action(attendance_admin, 'mark_available', Attendance.objects.all())
+        self.assertFalse(Attendance.objects.filter(is_available=False).exists())
+        self.run_action(attendance_admin, 'mark_unavailable', Attendance.objects.all())
+        self.assertFalse(Attendance.objects.filter(is_available=True).exists())
+
+
+class TaskChangelistTests(TestCase):
+    def test_query_count_does_not_grow_with_rows(self):
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'password'))
+        url = reverse('admin:taskassignment_task_changelist')
+        start = date(2026, 1, 5)
+
+        def add_tasks(count):
+            for i in range(count):
+                contributor = Contributor.objects.create(name=f'C{Contributor.objects.count()}',
+                                                         email=f'c{Contributor.objects.count()}@example.com')
+                make_task(contributor, start, start + timedelta(days=3))
+
+        add_tasks(2)
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as baseline:
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+        add_tasks(5)
+        with self.assertNumQueries(len(baseline.captured_queries)):
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+
+class TaskDeadlineTests(TestCase):
+    def setUp(self):
+        self.today = date.today()
+        self.alice = Contributor.objects.create(name='Alice', email='alice@example.com')
+        self.bob = Contributor.objects.create(name='Bob', email='bob@example.com')
+
+    def task_ending(self, contributor, days_from_today, is_completed=False):
+        end_date = self.today + timedelta(days=days_from_today)
+        return make_task(contributor, end_date - timedelta(days=30), end_date, is_completed)
+
+    def test_overdue_and_due_soon_boundaries(self):
+        yesterday = self.task_ending(self.alice, -1)
+        today = self.task_ending(self.alice, 0)
+        last_due = self.task_ending(self.alice, DUE_SOON_DAYS)
+        self.task_ending(self.alice, DUE_SOON_DAYS + 1)
+        self.task_ending(self.alice, -1, is_completed=True)
+        self.task_ending(self.alice, 0, is_completed=True)
+
+        self.assertEqual(list(Task.objects.overdue()), [yesterday])
+        self.assertEqual(set(Task.objects.due_soon()), {today, last_due})
+
+    def test_build_task_digest_counts_per_contributor(self):
+        alice_overdue = [self.task_ending(self.alice, -3), self.task_ending(self.alice, -1)]
+        alice_due = self.task_ending(self.alice, 2)
+        bob_due = self.task_ending(self.bob, DUE_SOON_DAYS)
+        self.task_ending(self.bob, -2, is_completed=True)
+        self.task_ending(self.bob, DUE_SOON_DAYS + 1)
+
+        call_command('build_task_digest', stdout=StringIO())
+
+        alice = TaskDigest.objects.get(contributor=self.alice)
+        self.assertEqual(alice.overdue_count, 2)
+        self.assertEqual(alice.overdue_task_ids, [t.id for t in alice_overdue])
+        self.assertEqual((alice.due_soon_count, alice.due_soon_task_ids), (1, [alice_due.id]))
+        bob = TaskDigest.objects.get(contributor=self.bob)
+        self.assertEqual((bob.overdue_count, bob.overdue_task_ids), (0, []))
+        self.assertEqual((bob.due_soon_count, bob.due_soon_task_ids), (1, [bob_due.id]))
+        self.assertEqual(TaskDigestBuild.objects.get().digest_date, self.today)
+
+    def test_rebuild_replaces_previous_rows(self):
+        task = self.task_ending(self.alice, -1)
+        self.task_ending(self.bob, -1)
+        call_command('build_task_digest', stdout=StringIO())
+
+        task.is_completed = True
+        task.save()
+        call_command('build_task_digest', stdout=StringIO())
+
+        self.assertEqual(list(TaskDigest.objects.values_list('contributor_id', flat=True)), [self.bob.id])
+        self.assertEqual(TaskDigestBuild.objects.count(), 2)
+
+    def test_empty_build_is_recorded_for_dashboard(self):
+        call_command('build_task_digest', stdout=StringIO())
+        self.assertFalse(TaskDigest.objects.exists())
+        response = self.client.get(reverse('taskassignment:dashboard'))
+        self.assertEqual(response.context['digest_date'], self.today)
+        self.assertEqual(response.context['overdue_tasks'], 0)
+
+    def test_dashboard_reads_digest_not_tasks(self):
+        # Digest values deliberately disagree with the task table
+        self.task_ending(self.alice, -1)
+        TaskDigest.objects.create(contributor=self.bob, overdue_count=4, due_soon_count=2)
+        TaskDigestBuild.objects.create(digest_date=self.today)
+
+        response = self.client.get(reverse('taskassignment:dashboard'))
+        self.assertEqual(response.context['overdue_tasks'], 4)
+        self.assertEqual(response.context['due_soon_tasks'], 2)
+        self.assertEqual([d.contributor for d in response.context['overdue_by_contributor']], [self.bob])
+
+    def test_deadline_pages_paginate_by_contributor(self):
+        contributors = [Contributor.objects.create(name=f'Person {i}', email=f'person{i}@example.com') for i in range(6)]
+        for contributor in contributors:
+            self.task_ending(contributor, -1)
+            self.task_ending(contributor, 1)
+        self.task_ending(contributors[0], -2)
+
+        response = self.client.get(reverse('taskassignment:task_overdue'), {'page_size': 5})
+        self.assertEqual(response.context['contributors'].paginator.count, 6)
+        self.assertEqual(list(response.context['contributors']), contributors[:5])
+        self.assertEqual({t.contributor for t in response.context['tasks']}, set(contributors[:5]))
+        self.assertEqual(len(response.context['tasks']), 6)
+
+        response = self.client.get(reverse('taskassignment:task_due_soon'), {'page_size': 5, 'page': 2})
+        self.assertEqual(list(response.context['contributors']), contributors[5:])
+        self.assertEqual([t.contributor for t in response.context['tasks']], [contributors[5]])
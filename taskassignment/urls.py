@@ -21,8 +21,15 @@ urlpatterns = [
     path('tasks/<int:pk>/update/', views.task_update, name='task_update'),
     path('tasks/<int:pk>/delete/', views.task_delete, name='task_delete'),
     path('tasks/<int:pk>/toggle/', views.task_toggle_complete, name='task_toggle_complete'),
+    path('tasks/overdue/', views.task_overdue, name='task_overdue'),
+    path('tasks/due-soon/', views.task_due_soon, name='task_due_soon'),
+    path('tasks/events/', views.task_events, name='task_events'),
 
-    # Attendance URLs (only list and take)
+    # Attendance URLs
     path('attendance/', views.attendance_list, name='attendance_list'),
     path('attendance/take/', views.attendance_take, name='attendance_take'),
+    path('attendance/save/', views.attendance_save, name='attendance_save'),
+
+    # Calendar URLs
+    path('calendar/', views.workload_calendar, name='workload_calendar'),
 ]
@@ -1,11 +1,14 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib import messages
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.db.models import Sum
 from django.core.paginator import Paginator
 from taskassignment.models import *
 from taskassignment.forms import *
+from taskassignment.events import live_updates_enabled, publish_task_event, subscribe
 from django.utils.dateparse import parse_date
-from datetime import date as dt_date
+from datetime import date as dt_date, timedelta
+import json
 
 # Create your views here.
 
@@ -125,7 +128,8 @@ def task_list(request):
         'status_filter': status_filter,
         'contributor_filter': contributor_filter,
         'page_size': page_size,
-        'page_sizes': [5, 10, 20, 50]
+        'page_sizes': [5, 10, 20, 50],
+        'live_updates': live_updates_enabled(request),
     })
 
 def task_detail(request, pk):
@@ -138,7 +142,8 @@ def task_create(request):
     if request.method == 'POST':
         form = TaskForm(request.POST)
         if form.is_valid():
-            form.save()
+            task = form.save()
+            publish_task_event('task_created', task)
             messages.success(request, 'Task created successfully!')
             return redirect('taskassignment:task_list')
     else:
@@ -152,6 +157,7 @@ def task_update(request, pk):
         form = TaskForm(request.POST, instance=task)
         if form.is_valid():
             form.save()
+            publish_task_event('task_updated', task)
             messages.success(request, 'Task updated successfully!')
             return redirect('taskassignment:task_detail', pk=pk)
     else:
@@ -176,6 +182,7 @@ def task_toggle_complete(request, pk):
     task = get_object_or_404(Task, pk=pk)
     task.is_completed = not task.is_completed
     task.save()
+    publish_task_event('task_toggled', task)
     
     if request.headers.get('Accept') == 'application/json':
         return JsonResponse({
@@ -186,6 +193,59 @@ def task_toggle_complete(request, pk):
     messages.success(request, f'Task marked as {"completed" if task.is_completed else "pending"}!')
     return redirect('taskassignment:task_detail', pk=pk)
 
+def _render_task_deadlines(request, tasks, title, subtitle):
+    """Render pending tasks grouped by contributor, paginating over contributors"""
+    contributors_list = (Contributor.objects.filter(id__in=tasks.values('contributor_id'))
+                         .order_by('name', 'id'))
+
+    # Get page size from request, default to 10
+    page_size = request.GET.get('page_size', '10')
+    try:
+        page_size = int(page_size)
+        if page_size not in [5, 10, 20, 50]:
+            page_size = 10
+    except (ValueError, TypeError):
+        page_size = 10
+
+    paginator = Paginator(contributors_list, page_size)
+    contributors = paginator.get_page(request.GET.get('page'))
+
+    page_tasks = (tasks.filter(contributor_id__in=[c.id for c in contributors])
+                  .select_related('contributor').order_by('contributor__name', 'contributor_id', 'end_date'))
+    return render(request, 'taskassignment/task_overdue.html', {
+        'tasks': page_tasks,
+        'contributors': contributors,
+        'title': title,
+        'subtitle': subtitle,
+        'page_size': page_size,
+    })
+
+def task_overdue(request):
+    """Pending tasks past their end date, grouped by contributor"""
+    return _render_task_deadlines(request, Task.objects.overdue(), 'Overdue Tasks',
+                                  'Pending tasks whose end date has passed')
+
+def task_due_soon(request):
+    """Pending tasks ending within the next DUE_SOON_DAYS days, grouped by contributor"""
+    return _render_task_deadlines(request, Task.objects.due_soon(), 'Tasks Due Soon',
+                                  f'Pending tasks ending within the next {DUE_SOON_DAYS} days')
+
+async def task_events(request):
+    """Server-sent event stream of task changes; needs an ASGI server (see tma/asgi.py)"""
+    if not live_updates_enabled(request):
+        # 204 tells EventSource to stop reconnecting
+        return HttpResponse(status=204)
+
+    async def event_stream():
+        yield 'retry: 3000\n\n'
+        async for payload in subscribe():
+            yield f'data: {payload}\n\n' if payload is not None else ': keep-alive\n\n'
+
+    response = StreamingHttpResponse(event_stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
 # ==================== DASHBOARD VIEWS ====================
 
 def dashboard(request):
@@ -207,6 +267,12 @@ def dashboard(request):
                 'contributor': contributor,
                 'task_count': task_count
             })
+
+    # Overdue stats come from the precomputed digest (see build_task_digest)
+    digest = TaskDigest.objects.aggregate(overdue=Sum('overdue_count'), due_soon=Sum('due_soon_count'))
+    overdue_by_contributor = (TaskDigest.objects.filter(overdue_count__gt=0)
+                              .select_related('contributor').order_by('-overdue_count')[:5])
+    digest_date = TaskDigestBuild.objects.order_by('-built_at').values_list('digest_date', flat=True).first()
     
     context = {
         'total_tasks': total_tasks,
@@ -214,7 +280,12 @@ def dashboard(request):
         'pending_tasks': pending_tasks,
         'total_contributors': total_contributors,
         'recent_tasks': recent_tasks,
-        'tasks_by_contributor': tasks_by_contributor
+        'tasks_by_contributor': tasks_by_contributor,
+        'overdue_tasks': digest['overdue'] or 0,
+        'due_soon_tasks': digest['due_soon'] or 0,
+        'overdue_by_contributor': overdue_by_contributor,
+        'digest_date': digest_date,
+        'live_updates': live_updates_enabled(request),
     }
     
     return render(request, 'taskassignment/dashboard.html', context)
@@ -229,53 +300,209 @@ def attendance_list(request):
     })
 
 
+# Upper bound on rows accepted by a single attendance diff
+ATTENDANCE_MAX_CHANGES = 1000
+
+
+def _apply_attendance_changes(day, changes):
+    """Upsert {contributor_id: is_available} for one day in a single INSERT ... ON CONFLICT statement"""
+    valid_ids = set(Contributor.objects.filter(id__in=changes.keys()).values_list('id', flat=True))
+    records = [
+        Attendance(contributor_id=cid, date=day, is_available=is_available)
+        for cid, is_available in changes.items() if cid in valid_ids
+    ]
+    Attendance.objects.bulk_create(
+        records,
+        update_conflicts=True,
+        unique_fields=['contributor', 'date'],
+        update_fields=['is_available'],
+    )
+    return len(records)
+
+
 def attendance_take(request):
-    """Bulk take attendance for a given date across all contributors"""
+    """Take attendance for a given date one page of contributors at a time"""
     if request.method == 'POST':
+        # Non-JS fallback: only the contributors rendered on the submitted page are written
         day_str = request.POST.get('date')
-        day = parse_date(day_str) if day_str else dt_date.today()
+        try:
+            day = parse_date(day_str) if day_str else dt_date.today()
+        except ValueError:
+            # Well-formed but impossible dates such as 2024-02-30
+            day = None
         if not day:
             messages.error(request, 'Invalid date provided.')
             return redirect('taskassignment:attendance_take')
 
-        # Build map of contributor_id -> is_available from form
-        availability = {}
-        for key, val in request.POST.items():
-            if key.startswith('present_'):
-                try:
-                    contributor_id = int(key.split('_', 1)[1])
-                    availability[contributor_id] = (val == 'on')
-                except Exception:
-                    continue
-
-        # Ensure all contributors are represented; default unchecked to False
-        all_ids = list(Contributor.objects.values_list('id', flat=True))
-        for cid in all_ids:
-            if cid not in availability:
-                availability[cid] = False
-
-        # Save or update records for the date
-        for contributor_id, is_available in availability.items():
-            Attendance.objects.update_or_create(
-                contributor_id=contributor_id,
-                date=day,
-                defaults={'is_available': is_available}
-            )
-
-        messages.success(request, f'Attendance saved for {day}.')
+        changes = {}
+        for value in request.POST.getlist('contributor_ids'):
+            try:
+                contributor_id = int(value)
+            except (ValueError, TypeError):
+                continue
+            changes[contributor_id] = request.POST.get(f'present_{contributor_id}') == 'on'
+
+        saved = _apply_attendance_changes(day, changes)
+        messages.success(request, f'Attendance saved for {day} ({saved} contributors).')
         return redirect('taskassignment:attendance_list')
 
-    # GET: show form for today's date with all contributors
-    day = dt_date.today()
-    contributors = Contributor.objects.all().order_by('name')
+    try:
+        day = parse_date(request.GET.get('date') or '') or dt_date.today()
+    except ValueError:
+        # Well-formed but impossible dates such as 2024-02-30
+        day = dt_date.today()
+
+    contributors_list = Contributor.objects.all().order_by('name', 'id')
+    search = request.GET.get('q', '').strip()
+    if search:
+        contributors_list = contributors_list.filter(name__istartswith=search)
 
-    # Pull existing records to pre-check
-    existing = {a.contributor_id: a.is_available for a in Attendance.objects.filter(date=day)}
-    present_ids = [cid for cid, is_avail in existing.items() if is_avail]
+    # Get page size from request, default to 50
+    page_size = request.GET.get('page_size', '50')
+    try:
+        page_size = int(page_size)
+        if page_size not in [20, 50, 100]:
+            page_size = 50
+    except (ValueError, TypeError):
+        page_size = 50
+
+    paginator = Paginator(contributors_list, page_size)
+    contributors = paginator.get_page(request.GET.get('page'))
+
+    # Pull existing records for the visible page only
+    page_ids = [c.id for c in contributors]
+    present_ids = set(Attendance.objects.filter(
+        date=day, contributor_id__in=page_ids, is_available=True
+    ).values_list('contributor_id', flat=True))
 
     return render(request, 'taskassignment/attendance_take.html', {
         'day': day,
         'contributors': contributors,
-        'existing': existing,
         'present_ids': present_ids,
-    })
\ No newline at end of file
+        'search': search,
+        'page_size': page_size,
+        'page_sizes': [20, 50, 100],
+    })
+
+
+def attendance_save(request):
+    """Apply a JSON diff of changed attendance rows: {"date": ..., "changes": {"<id>": true|false}}"""
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'error': 'POST required.'}, status=405)
+
+    try:
+        payload = json.loads(request.body)
+        day = parse_date(payload.get('date') or '')
+        changes = {int(cid): value for cid, value in payload.get('changes', {}).items()}
+    except (ValueError, TypeError, AttributeError):
+        return JsonResponse({'success': False, 'error': 'Malformed request body.'}, status=400)
+
+    if not all(isinstance(value, bool) for value in changes.values()):
+        return JsonResponse({'success': False, 'error': 'Change values must be true or false.'}, status=400)
+
+    if not day:
+        return JsonResponse({'success': False, 'error': 'Invalid date provided.'}, status=400)
+    if len(changes) > ATTENDANCE_MAX_CHANGES:
+        return JsonResponse({'success': False, 'error': f'At most {ATTENDANCE_MAX_CHANGES} changes per request.'}, status=400)
+
+    saved = _apply_attendance_changes(day, changes)
+    return JsonResponse({'success': True, 'saved': saved})
+
+# ==================== CALENDAR VIEWS ====================
+
+def workload_calendar(request):
+    """Contributor-by-day grid of active tasks and attendance for a date window"""
+    try:
+        first_day = parse_date(request.GET.get('start') or '')
+    except ValueError:
+        # Well-formed but impossible dates such as 2024-02-30
+        first_day = None
+    if not first_day:
+        # Default to the current week, starting Monday
+        first_day = dt_date.today()
+        first_day -= timedelta(days=first_day.weekday())
+
+    try:
+        num_days = min(max(int(request.GET.get('days', 7)), 1), 31)
+    except (ValueError, TypeError):
+        num_days = 7
+    days = [first_day + timedelta(days=i) for i in range(num_days)]
+    last_day = days[-1]
+
+    # Get page size from request, default to 100
+    page_size = request.GET.get('page_size', '100')
+    try:
+        page_size = int(page_size)
+        if page_size not in [50, 100, 200, 500]:
+            page_size = 100
+    except (ValueError, TypeError):
+        page_size = 100
+
+    paginator = Paginator(Contributor.objects.all().order_by('name', 'id'), page_size)
+    contributors = paginator.get_page(request.GET.get('page'))
+    page_ids = [c.id for c in contributors]
+
+    # One range-overlap query for every task on the page, one query for attendance
+    tasks_by_contributor = {}
+    for task in (Task.objects.active_between(first_day, last_day)
+                 .filter(contributor_id__in=page_ids)
+                 .only('id', 'title', 'start', 'end_date', 'is_completed', 'contributor_id')
+                 .order_by('start')):
+        tasks_by_contributor.setdefault(task.contributor_id, []).append(task)
+
+    availability = {
+        (cid, day): is_available
+        for cid, day, is_available in Attendance.objects.filter(
+            contributor_id__in=page_ids, date__range=(first_day, last_day)
+        ).values_list('contributor_id', 'date', 'is_available')
+    }
+
+    rows = []
+    for contributor in contributors:
+        tasks = tasks_by_contributor.get(contributor.id, [])
+        rows.append({
+            'contributor': contributor,
+            'days': [{
+                'date': day,
+                'available': availability.get((contributor.id, day)),
+                'tasks': [t for t in tasks if t.start.date() <= day <= t.end_date],
+            } for day in days],
+        })
+
+    if request.GET.get('format') == 'json':
+        return JsonResponse({
+            'start': first_day.isoformat(),
+            'end': last_day.isoformat(),
+            'page': contributors.number,
+            'num_pages': paginator.num_pages,
+            'contributors': [{
+                'id': row['contributor'].id,
+                'name': row['contributor'].name,
+                'days': [{
+                    'date': cell['date'].isoformat(),
+                    'available': cell['available'],
+                    'tasks': [t.id for t in cell['tasks']],
+                } for cell in row['days']],
+            } for row in rows],
+            'tasks': {
+                t.id: {
+                    'title': t.title,
+                    'start': t.start.isoformat(),
+                    'end_date': t.end_date.isoformat(),
+                    'is_completed': t.is_completed,
+                }
+                for tasks in tasks_by_contributor.values() for t in tasks
+            },
+        })
+
+    return render(request, 'taskassignment/workload_calendar.html', {
+        'days': days,
+        'rows': rows,
+        'contributors': contributors,
+        'first_day': first_day,
+        'num_days': num_days,
+        'previous_start': first_day - timedelta(days=num_days),
+        'next_start': first_day + timedelta(days=num_days),
+        'page_size': page_size,
+        'page_sizes': [50, 100, 200, 500],
+    })
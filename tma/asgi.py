@@ -3,6 +3,10 @@ ASGI config for tma project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Serve with an ASGI server (e.g. ``uvicorn tma.asgi:application``) so the
+long-lived task event stream at ``/tasks/events/`` does not tie up a worker
+thread per connected client.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
 """
@@ -37,6 +37,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'taskassignment',
 ]
 
@@ -85,6 +86,12 @@ DATABASES = {
         }
     }
 
+# Live task updates (server-sent events), only streamed when served over ASGI
+# 'local' fans events out within one process; use 'postgres' (LISTEN/NOTIFY) with several ASGI workers
+
+TASK_EVENTS_ENABLED = True
+TASK_EVENTS_BACKEND = 'local'
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 